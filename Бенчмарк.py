@@ -0,0 +1,133 @@
+import argparse
+import random
+import sys
+import time
+
+from Шахматы import (
+    Color, Pawn, Rook, Knight, Bishop, Queen, King, Checker, CheckerKing,
+    ChessGame, CheckersGame, SearchPlayer,
+)
+
+# Фигуры в записи позиции (как в нотации FEN: заглавные буквы - белые)
+FEN_PIECES = {
+    'p': Pawn,
+    'r': Rook,
+    'n': Knight,
+    'b': Bishop,
+    'q': Queen,
+    'k': King,
+}
+
+# Шашки в записи позиции: m - простая шашка, k - дамка
+CHECKERS_PIECES = {
+    'm': Checker,
+    'k': CheckerKing,
+}
+
+# Тактические позиции: название, расстановка, чей ход, лучший ход
+POSITIONS = [
+    ("Отравленная пешка", "4k3/8/2p5/3p4/8/8/8/3QK3", Color.WHITE, None),
+    ("Незащищенный ферзь", "r3k3/8/8/3q4/8/8/3R4/3RK3", Color.WHITE, "d2d5"),
+    ("Защищенная ладья", "4k3/8/2p5/3r4/8/4N3/8/3RK3", Color.WHITE, "e3d5"),
+    ("Размен на e5", "3qk3/3r4/3p1n2/4p3/3P4/2N2N2/8/3QK3", Color.WHITE, None),
+    ("Связка слоном", "r2qk2r/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2QK2R", Color.WHITE, None),
+    ("Итальянская партия", "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQK2R", Color.BLACK, None),
+]
+
+# Проверки статической оценки размена: тип игры, расстановка, чей ход, взятие, ожидаемый выигрыш
+SEE_CHECKS = [
+    ("chess", "4k3/8/2p5/3p4/8/8/8/3QK3", Color.WHITE, "d1d5", -8),
+    ("chess", "r3k3/8/8/3q4/8/8/3R4/3RK3", Color.WHITE, "d2d5", 9),
+    ("chess", "4k3/8/2p5/3r4/8/4N3/8/3RK3", Color.WHITE, "e3d5", 3),
+    ("chess", "4k3/8/2p5/3r4/8/4N3/8/3RK3", Color.WHITE, "d1d5", 1),
+    # Ладья d1 за ладьей d2 (рентген) удерживает черную ладью от взятия
+    ("chess", "3rk3/8/8/3n4/8/8/3R4/3RK3", Color.WHITE, "d2d5", 3),
+    ("chess", "3rk3/8/8/3n4/8/8/3R4/4K3", Color.WHITE, "d2d5", -2),
+    # Пешку рентген не останавливает: после exd5 Rxd5 белые теряют качество
+    ("chess", "4k3/8/4p3/3n4/8/8/3R4/3RK3", Color.WHITE, "d2d5", -1),
+    ("checkers", "8/8/8/8/3m4/2M5/8/8", Color.WHITE, "c3e5", 1),
+    ("checkers", "8/8/5m2/8/3m4/2M5/8/8", Color.WHITE, "c3e5", 0),
+    ("checkers", "8/8/5k2/8/3m4/2M5/8/8", Color.WHITE, "c3e5", 0),
+    ("checkers", "8/k7/8/8/3m4/2M5/8/8", Color.WHITE, "c3e5", 1),
+]
+
+# Проверяемые варианты перебора: название и параметры SearchPlayer
+CONFIGS = [
+    ("без форсированного перебора", {"quiescence": False}),
+    ("взятия без SEE", {"quiescence": True, "see_pruning": False}),
+    ("взятия с SEE", {"quiescence": True, "see_pruning": True}),
+]
+
+
+def load_position(placement, color, game_type="chess"):
+    """
+    Создает партию с расстановкой фигур в нотации FEN.
+
+    :param placement: Расстановка фигур (первая часть записи FEN).
+    :param color: Цвет стороны, чей ход.
+    :param game_type: Тип игры ("chess" или "checkers").
+    :return: Объект ChessGame или CheckersGame.
+    """
+    game = ChessGame() if game_type == "chess" else CheckersGame()
+    pieces = FEN_PIECES if game_type == "chess" else CHECKERS_PIECES
+    board = [[None for _ in range(8)] for _ in range(8)]
+    for x, row in enumerate(placement.split("/")):
+        y = 0
+        for symbol in row:
+            if symbol.isdigit():
+                y += int(symbol)
+            else:
+                piece_color = Color.WHITE if symbol.isupper() else Color.BLACK
+                board[x][y] = pieces[symbol.lower()](piece_color)
+                y += 1
+    game.board.board = board
+    game.current_turn = color
+    return game
+
+
+# Запуск сравнения на тактических позициях
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение перебора со статической оценкой размена и без нее")
+    parser.add_argument("--depth", type=int, default=2, help="глубина основного перебора")
+    args = parser.parse_args()
+
+    failures = []
+    print("Статическая оценка размена:")
+    for game_type, placement, color, notation, expected in SEE_CHECKS:
+        game = load_position(placement, color, game_type)
+        move = (game.parse_position(notation[0:2]), game.parse_position(notation[2:4]))
+        gain = game.board.static_exchange(move)
+        status = "ок" if gain == expected else "ОШИБКА"
+        print(f"  {game_type:8} {placement:36} {notation} {gain:+d} (ожидается {expected:+d}) {status}")
+        if gain != expected:
+            failures.append(f"SEE {notation} в {placement}: {gain:+d} вместо {expected:+d}")
+
+    totals = {name: [0, 0.0] for name, _ in CONFIGS}
+    for title, placement, color, best in POSITIONS:
+        game = load_position(placement, color)
+        print(f"{title} ({'белые' if color == Color.WHITE else 'черные'}), лучший ход: {best or '-'}")
+        captures = game.board.get_legal_moves(color, captures_only=True)
+        exchanges = ", ".join(
+            f"{game.format_position(start)}{game.format_position(end)} {game.board.static_exchange((start, end)):+d}"
+            for start, end in captures
+        )
+        print(f"  SEE: {exchanges or '-'}")
+        for name, options in CONFIGS:
+            player = SearchPlayer(args.depth, random.Random(0), **options)
+            started = time.perf_counter()
+            start, end = player.choose_move(game.copy())
+            elapsed = time.perf_counter() - started
+            move = game.format_position(start) + game.format_position(end)
+            totals[name][0] += player.nodes
+            totals[name][1] += elapsed
+            print(f"  {name:28} ход {move}, узлов {player.nodes:7}, время {1000 * elapsed:9.1f} мс")
+            if best and move != best:
+                failures.append(f"{title}, {name}: ход {move} вместо {best}")
+    print("Итого:")
+    for name, (nodes, elapsed) in totals.items():
+        print(f"  {name:28} узлов {nodes:7}, время {1000 * elapsed:9.1f} мс")
+    if failures:
+        print("Ошибки:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
@@ -0,0 +1,268 @@
+import argparse
+import mmap
+import random
+import struct
+from collections import defaultdict
+
+from Шахматы import Color, Queen, Rook, Bishop, Knight, Player
+from Турнир import GAME_TYPES, decode_move
+
+# Заголовок файла книги: сигнатура, тип игры, число записей
+HEADER = struct.Struct("<4s8sI")
+MAGIC = b"OBK1"
+# Запись книги: ключ позиции, ход, вес
+RECORD = struct.Struct("<QHI")
+
+# Коды фигур для превращения пешки в записи хода
+PROMOTION_CODES = {
+    None: 0,
+    Queen: 1,
+    Rook: 2,
+    Bishop: 3,
+    Knight: 4,
+}
+PROMOTION_PIECES = {code: piece for piece, code in PROMOTION_CODES.items()}
+
+# Вес хода за победу, ничью и поражение стороны, сделавшей ход
+RESULT_WEIGHTS = {
+    "1-0": {Color.WHITE: 2, Color.BLACK: 0},
+    "0-1": {Color.WHITE: 0, Color.BLACK: 2},
+    "1/2-1/2": {Color.WHITE: 1, Color.BLACK: 1},
+}
+
+
+def encode_book_move(start, end, promotion=None):
+    """
+    Упаковывает ход в 16-битное число: 6 бит начального поля, 6 бит конечного поля, 3 бита превращения.
+
+    :param start: Кортеж (x, y) начальной позиции.
+    :param end: Кортеж (x, y) конечной позиции.
+    :param promotion: Класс фигуры для превращения пешки или None.
+    :return: Целое число.
+    """
+    return (start[0] * 8 + start[1]) | (end[0] * 8 + end[1]) << 6 | PROMOTION_CODES[promotion] << 12
+
+
+def decode_book_move(code):
+    """
+    Распаковывает ход, упакованный encode_book_move.
+
+    :param code: Целое число.
+    :return: Кортеж (start, end, класс фигуры для превращения или None).
+    """
+    start = code & 63
+    end = (code >> 6) & 63
+    return divmod(start, 8), divmod(end, 8), PROMOTION_PIECES[code >> 12]
+
+
+# Класс для построения дебютной книги по архиву партий
+class OpeningBookBuilder:
+    def __init__(self, game_type, max_plies=20):
+        """
+        Инициализирует построитель книги.
+
+        :param game_type: Тип игры ("chess" или "checkers").
+        :param max_plies: Число первых полуходов партии, попадающих в книгу.
+        """
+        if game_type not in GAME_TYPES:
+            raise ValueError(f"Неизвестный тип игры: {game_type}")
+        self.game_type = game_type
+        self.max_plies = max_plies
+        self.weights = defaultdict(int)
+        self.games = 0
+
+    def add_game(self, moves, result):
+        """
+        Добавляет в книгу дебютные ходы одной партии.
+
+        :param moves: Список ходов в нотации турнира (например, "e2e4").
+        :param result: Результат партии ("1-0", "0-1" или "1/2-1/2").
+        """
+        game = GAME_TYPES[self.game_type]()
+        for notation in moves[:self.max_plies]:
+            start, end, promotion = decode_move(game, notation)
+            key = game.board.position_key(game.current_turn)
+            # Ход без побед тоже попадает в книгу, чтобы его можно было найти
+            weight = RESULT_WEIGHTS[result][game.current_turn]
+            self.weights[(key, encode_book_move(start, end, promotion))] += weight
+            game.execute_move(start, end, promotion=promotion)
+            game.switch_turn()
+        self.games += 1
+
+    def add_archive(self, path):
+        """
+        Добавляет партии из архива, записанного турниром. Партии других игр пропускаются.
+
+        :param path: Путь к файлу архива.
+        """
+        with open(path, encoding="utf-8") as archive:
+            for line in archive:
+                if not line.strip():
+                    continue
+                game_type, _, _, result, moves = line.rstrip("\n").split("\t")
+                if game_type == self.game_type:
+                    self.add_game(moves.split(), result)
+
+    def write(self, path):
+        """
+        Записывает книгу в файл: заголовок и записи, отсортированные по ключу позиции.
+
+        :param path: Путь к файлу книги.
+        :return: Число записанных записей.
+        """
+        records = sorted(self.weights.items())
+        with open(path, "wb") as book:
+            book.write(HEADER.pack(MAGIC, self.game_type.encode("ascii"), len(records)))
+            for (key, move), weight in records:
+                book.write(RECORD.pack(key, move, min(weight, 0xFFFFFFFF)))
+        return len(records)
+
+
+# Класс для поиска ходов в дебютной книге
+class OpeningBook:
+    def __init__(self, path):
+        """
+        Открывает файл книги и отображает его в память.
+
+        :param path: Путь к файлу книги.
+        """
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"Пустой файл книги: {path}")
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f"Файл не является дебютной книгой: {path}")
+        magic, game_type, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or len(self.data) != HEADER.size + self.count * RECORD.size:
+            self.close()
+            raise ValueError(f"Файл не является дебютной книгой: {path}")
+        self.game_type = game_type.rstrip(b"\0").decode("ascii")
+
+    def close(self):
+        """
+        Закрывает файл книги.
+        """
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def key_at(self, index):
+        """
+        Возвращает ключ позиции записи с указанным номером.
+
+        :param index: Номер записи.
+        :return: Ключ позиции.
+        """
+        return struct.unpack_from("<Q", self.data, HEADER.size + index * RECORD.size)[0]
+
+    def lookup(self, game):
+        """
+        Находит ходы из книги для текущей позиции двоичным поиском.
+
+        :param game: Объект игры.
+        :return: Список кортежей (start, end, promotion, weight).
+        """
+        if game.board.game_type != self.game_type:
+            raise ValueError(f"Книга для игры {self.game_type}, а не {game.board.game_type}")
+        key = game.board.position_key(game.current_turn)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        entries = []
+        for index in range(low, self.count):
+            record_key, move, weight = RECORD.unpack_from(self.data, HEADER.size + index * RECORD.size)
+            if record_key != key:
+                break
+            entries.append((*decode_book_move(move), weight))
+        return entries
+
+    def choose_move(self, game, rng=random):
+        """
+        Выбирает ход из книги случайно с учетом весов.
+
+        :param game: Объект игры.
+        :param rng: Генератор случайных чисел.
+        :return: Кортеж (start, end, promotion) или None, если позиции нет в книге.
+        """
+        entries = [entry for entry in self.lookup(game) if entry[3] > 0]
+        if not entries:
+            return None
+        start, end, promotion, _ = rng.choices(entries, weights=[entry[3] for entry in entries])[0]
+        return start, end, promotion
+
+
+# Игрок, который играет по книге, пока позиция в ней есть, а затем передает ход другому игроку
+class BookPlayer(Player):
+    def __init__(self, book, fallback, rng=None):
+        """
+        Инициализирует игрока с дебютной книгой.
+
+        :param book: Объект OpeningBook.
+        :param fallback: Игрок, который ходит вне книги.
+        :param rng: Объект random.Random (если None, создается новый).
+        """
+        super().__init__(rng)
+        self.book = book
+        self.fallback = fallback
+
+    def choose_move(self, game, moves=None):
+        """
+        Выбирает ход из книги, если он допустим, иначе спрашивает запасного игрока.
+
+        :param game: Объект игры.
+        :param moves: Уже найденные допустимые ходы (если None, они будут найдены).
+        :return: Кортеж (start, end) или None, если ходов нет.
+        """
+        if moves is None:
+            moves = game.board.get_legal_moves(game.current_turn)
+        book_move = self.book.choose_move(game, self.rng)
+        if book_move and book_move[:2] in moves:
+            return book_move[:2]
+        return self.fallback.choose_move(game, moves)
+
+
+# Построение книги или поиск ходов из командной строки
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Дебютная книга для шахмат и шашек")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="построить книгу по архивам партий")
+    build.add_argument("book", help="файл книги")
+    build.add_argument("archives", nargs="+", help="архивы партий, записанные турниром")
+    build.add_argument("--game", choices=sorted(GAME_TYPES), default="chess", help="тип игры")
+    build.add_argument("--max-plies", type=int, default=20, help="число первых полуходов партии в книге")
+    show = commands.add_parser("show", help="показать ходы книги после заданных ходов")
+    show.add_argument("book", help="файл книги")
+    show.add_argument("moves", nargs="*", help="ходы от начальной позиции (например, e2e4 e7e5)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        builder = OpeningBookBuilder(args.game, args.max_plies)
+        for archive in args.archives:
+            builder.add_archive(archive)
+        count = builder.write(args.book)
+        print(f"Партий: {builder.games}, записей в книге: {count}")
+    else:
+        with OpeningBook(args.book) as book:
+            game = GAME_TYPES[book.game_type]()
+            for notation in args.moves:
+                start, end, promotion = decode_move(game, notation)
+                game.execute_move(start, end, promotion=promotion)
+                game.switch_turn()
+            game.board.display()
+            entries = sorted(book.lookup(game), key=lambda entry: entry[3], reverse=True)
+            if not entries:
+                print("Позиции нет в книге.")
+            for start, end, promotion, weight in entries:
+                print(f"{game.format_position(start)}{game.format_position(end)}: {weight}")
@@ -0,0 +1,397 @@
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Шахматы import (
+    Color, Pawn, Queen, Rook, Bishop, Knight,
+    ChessGame, CheckersGame, RandomPlayer, GreedyPlayer, SearchPlayer,
+)
+
+# Типы игр, доступные для турнира
+GAME_TYPES = {
+    "chess": ChessGame,
+    "checkers": CheckersGame,
+}
+
+# Буквы для записи превращения пешки
+PROMOTION_LETTERS = {
+    Queen: 'q',
+    Rook: 'r',
+    Bishop: 'b',
+    Knight: 'n',
+}
+
+# Открытые дебютные книги рабочего процесса (по пути к файлу)
+BOOKS = {}
+
+# Названия игроков, с которых может начинаться описание игрока
+PLAYER_NAMES = ("random", "greedy", "search", "qsearch", "book")
+
+# Обозначения результатов партии
+RESULTS = {
+    Color.WHITE: "1-0",
+    Color.BLACK: "0-1",
+    "draw": "1/2-1/2",
+}
+
+
+def make_player(spec, rng, books=BOOKS):
+    """
+    Создает автоматического игрока по его описанию.
+
+    :param spec: Описание игрока: "random", "greedy", "search:N", "qsearch:N"
+                 (N - глубина перебора, qsearch - с форсированным перебором взятий)
+                 или "book:PATH:SPEC" (ходы из книги PATH, вне книги - игрок SPEC).
+    :param rng: Объект random.Random для игрока.
+    :param books: Словарь уже открытых книг по пути к файлу (новые книги добавляются в него).
+    :return: Объект игрока.
+    """
+    name, _, depth = spec.partition(":")
+    if name == "book":
+        # Импорт здесь, потому что Дебюты.py сам импортирует этот модуль
+        from Дебюты import OpeningBook, BookPlayer
+        path, fallback = split_book_spec(depth)
+        if path not in books:
+            books[path] = OpeningBook(path)
+        return BookPlayer(books[path], make_player(fallback, rng, books), rng)
+    if name == "random":
+        return RandomPlayer(rng)
+    if name == "greedy":
+        return GreedyPlayer(rng)
+    if name == "search":
+        return SearchPlayer(int(depth) if depth else 2, rng)
+    if name == "qsearch":
+        return SearchPlayer(int(depth) if depth else 2, rng, quiescence=True)
+    raise ValueError(f"Неизвестный игрок: {spec}")
+
+
+def split_book_spec(spec):
+    """
+    Разделяет "PATH:SPEC" на путь к книге и описание запасного игрока.
+    Путь может содержать двоеточия (например, "C:\\books\\chess.bin"), поэтому
+    разделителем считается первое двоеточие, после которого идет название игрока.
+
+    :param spec: Строка "PATH:SPEC".
+    :return: Кортеж (путь к книге, описание запасного игрока).
+    """
+    index = spec.find(":")
+    while index != -1:
+        if spec[index + 1:].partition(":")[0] in PLAYER_NAMES:
+            return spec[:index], spec[index + 1:]
+        index = spec.find(":", index + 1)
+    raise ValueError(f"Не указан игрок вне книги: {spec}")
+
+
+def play_game(task):
+    """
+    Проводит одну партию между автоматическими игроками (выполняется в рабочем процессе).
+
+    :param task: Кортеж (game_type, white, black, seed, opening_plies, max_plies).
+    :return: Словарь с ходами, результатом и временем партии.
+    """
+    game_type, white, black, seed, opening_plies, max_plies = task
+    game = GAME_TYPES[game_type]()
+    # Дебют зависит только от seed, поэтому партии с обменом цветами начинаются одинаково
+    opening_rng = random.Random(seed)
+    players = {
+        Color.WHITE: make_player(white, random.Random(f"{seed}:white")),
+        Color.BLACK: make_player(black, random.Random(f"{seed}:black")),
+    }
+    think_time = {Color.WHITE: 0.0, Color.BLACK: 0.0}
+    think_moves = {Color.WHITE: 0, Color.BLACK: 0}
+    moves = []
+    started = time.perf_counter()
+    while True:
+        color = game.current_turn
+        legal_moves = game.board.get_legal_moves(color)
+        result = game.get_result(legal_moves)
+        if result:
+            break
+        if len(moves) >= max_plies:
+            result = "draw"
+            break
+        if len(moves) < opening_plies:
+            move = opening_rng.choice(legal_moves)
+        else:
+            move_started = time.perf_counter()
+            move = players[color].choose_move(game, legal_moves)
+            think_time[color] += time.perf_counter() - move_started
+            think_moves[color] += 1
+        moves.append(encode_move(game, move))
+        game.execute_move(*move, promotion=Queen)
+        game.switch_turn()
+    return {
+        "game_type": game_type,
+        "white": white,
+        "black": black,
+        "result": RESULTS[result],
+        "moves": moves,
+        "elapsed": time.perf_counter() - started,
+        "think_time": (think_time[Color.WHITE], think_time[Color.BLACK]),
+        "think_moves": (think_moves[Color.WHITE], think_moves[Color.BLACK]),
+    }
+
+
+def encode_move(game, move):
+    """
+    Записывает ход в компактной нотации (например, "e2e4" или "e7e8q").
+
+    :param game: Объект игры до выполнения хода.
+    :param move: Кортеж (start, end).
+    :return: Строка с ходом.
+    """
+    start, end = move
+    notation = game.format_position(start) + game.format_position(end)
+    if isinstance(game.board.get_piece(*start), Pawn) and end[0] in (0, 7):
+        notation += PROMOTION_LETTERS[Queen]
+    return notation
+
+
+def decode_move(game, notation):
+    """
+    Разбирает ход, записанный encode_move.
+
+    :param game: Объект игры.
+    :param notation: Строка с ходом (например, "e2e4" или "e7e8q").
+    :return: Кортеж (start, end, класс фигуры для превращения или None).
+    """
+    letters = {letter: piece for piece, letter in PROMOTION_LETTERS.items()}
+    start = game.parse_position(notation[0:2])
+    end = game.parse_position(notation[2:4])
+    return start, end, letters.get(notation[4:])
+
+
+def encode_game(record):
+    """
+    Записывает партию в одну строку: тип игры, игроки, результат и ходы через табуляцию.
+
+    :param record: Словарь, возвращаемый play_game.
+    :return: Строка с партией.
+    """
+    return "\t".join([record["game_type"], record["white"], record["black"], record["result"], " ".join(record["moves"])])
+
+
+def replay_game(line):
+    """
+    Восстанавливает партию из строки, записанной encode_game.
+
+    :param line: Строка с партией.
+    :return: Кортеж (игра в конечной позиции, белые, черные, результат).
+    """
+    game_type, white, black, result, moves = line.rstrip("\n").split("\t")
+    game = GAME_TYPES[game_type]()
+    for move in moves.split():
+        start, end, promotion = decode_move(game, move)
+        game.execute_move(start, end, promotion=promotion)
+        game.switch_turn()
+    return game, white, black, result
+
+
+def elo_estimate(wins, draws, losses):
+    """
+    Оценивает разницу в рейтинге Эло по результатам матча.
+
+    :param wins: Число побед первого игрока.
+    :param draws: Число ничьих.
+    :param losses: Число поражений первого игрока.
+    :return: Кортеж (разница Эло, нижняя и верхняя границы 95% доверительного интервала).
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0, -math.inf, math.inf
+    z = 1.96
+    score = (wins + 0.5 * draws) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    if variance > 0:
+        low = score - z * math.sqrt(variance / games)
+        high = score + z * math.sqrt(variance / games)
+    else:
+        # Все партии закончились одинаково (одни ничьи или разгром): наблюдаемый разброс
+        # равен нулю, поэтому берем интервал Уилсона, который не вырождается на малых выборках
+        center = (score + z ** 2 / (2 * games)) / (1 + z ** 2 / games)
+        half = z / (1 + z ** 2 / games) * math.sqrt(score * (1 - score) / games + z ** 2 / (4 * games ** 2))
+        low, high = center - half, center + half
+
+    def to_elo(p):
+        if p <= 0:
+            return -math.inf
+        if p >= 1:
+            return math.inf
+        return -400 * math.log10(1 / p - 1)
+
+    return to_elo(score), to_elo(low), to_elo(high)
+
+
+def format_elo(elo, low, high):
+    """
+    Записывает оценку Эло с погрешностью (например, "+35 ± 60").
+    При разгроме оценка бесконечна, поэтому выводится конечная граница интервала (например, "> +120").
+
+    :param elo: Разница Эло.
+    :param low: Нижняя граница доверительного интервала.
+    :param high: Верхняя граница доверительного интервала.
+    :return: Строка с оценкой.
+    """
+    if elo == math.inf:
+        return f"> {round(low) + 0:+d}"
+    if elo == -math.inf:
+        return f"< {round(high) + 0:+d}"
+    margin = (high - low) / 2
+    margin_text = "inf" if math.isinf(margin) else f"{round(margin)}"
+    return f"{round(elo) + 0:+d} ± {margin_text}"
+
+
+# Класс для проведения турнира между автоматическими игроками
+class Tournament:
+    def __init__(self, game_type, players, games_per_pair, opening_plies=4, max_plies=200, workers=None, seed=0):
+        """
+        Инициализирует турнир.
+
+        :param game_type: Тип игры ("chess" или "checkers").
+        :param players: Список описаний игроков (см. make_player).
+        :param games_per_pair: Число партий для каждой пары игроков.
+        :param opening_plies: Число случайных полуходов в начале партии.
+        :param max_plies: Число полуходов, после которого партия считается ничьей.
+        :param workers: Число рабочих процессов (если None, по числу процессоров).
+        :param seed: Начальное значение генератора случайных чисел.
+        """
+        if game_type not in GAME_TYPES:
+            raise ValueError(f"Неизвестный тип игры: {game_type}")
+        if len(players) < 2:
+            raise ValueError("Для турнира нужны хотя бы два игрока")
+        # Книги, открытые только для проверки, закрываются: рабочие процессы откроют свои
+        books = {}
+        try:
+            for spec in players:
+                player = make_player(spec, None, books)
+                while player:
+                    book = getattr(player, "book", None)
+                    if book and book.game_type != game_type:
+                        raise ValueError(f"Книга игрока {spec} для игры {book.game_type}, а не {game_type}")
+                    player = getattr(player, "fallback", None)
+        finally:
+            for book in books.values():
+                book.close()
+        self.game_type = game_type
+        self.players = players
+        self.games_per_pair = games_per_pair
+        self.opening_plies = opening_plies
+        self.max_plies = max_plies
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+
+    def schedule(self):
+        """
+        Составляет список партий. Каждый дебют играется дважды с обменом цветами.
+
+        :return: Список заданий для play_game.
+        """
+        rng = random.Random(self.seed)
+        tasks = []
+        for i, first in enumerate(self.players):
+            for second in self.players[i + 1:]:
+                for k in range(self.games_per_pair):
+                    if k % 2 == 0:
+                        opening_seed = rng.getrandbits(32)
+                    white, black = (first, second) if k % 2 == 0 else (second, first)
+                    tasks.append((self.game_type, white, black, opening_seed, self.opening_plies, self.max_plies))
+        return tasks
+
+    def run(self, output=None):
+        """
+        Проводит все партии турнира в рабочих процессах.
+
+        :param output: Путь к файлу для записи партий (если None, партии не сохраняются).
+        :return: Кортеж (список результатов партий, общее время в секундах).
+        """
+        tasks = self.schedule()
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        records = []
+        started = time.perf_counter()
+        games_file = open(output, "w", encoding="utf-8") if output else None
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for record in executor.map(play_game, tasks, chunksize=chunksize):
+                    records.append(record)
+                    if games_file:
+                        games_file.write(encode_game(record) + "\n")
+        finally:
+            if games_file:
+                games_file.close()
+        return records, time.perf_counter() - started
+
+    def report(self, records, wall_time):
+        """
+        Составляет отчет о турнире: результаты пар, оценки Эло и скорость игры.
+
+        :param records: Список результатов партий.
+        :param wall_time: Общее время турнира в секундах.
+        :return: Строка с отчетом.
+        """
+        lines = [f"Игра: {self.game_type}, партий: {len(records)}, рабочих процессов: {self.workers}"]
+        # Результаты пар с точки зрения первого игрока пары
+        lines.append("")
+        lines.append("Результаты пар (победы/ничьи/поражения первого игрока):")
+        for i, first in enumerate(self.players):
+            for second in self.players[i + 1:]:
+                wins = draws = losses = 0
+                for record in records:
+                    if {record["white"], record["black"]} != {first, second} or record["white"] == record["black"]:
+                        continue
+                    if record["result"] == "1/2-1/2":
+                        draws += 1
+                    elif (record["result"] == "1-0") == (record["white"] == first):
+                        wins += 1
+                    else:
+                        losses += 1
+                games = wins + draws + losses
+                if not games:
+                    continue
+                elo, low, high = elo_estimate(wins, draws, losses)
+                lines.append(
+                    f"  {first} - {second}: +{wins} ={draws} -{losses}, "
+                    f"очки {100 * (wins + 0.5 * draws) / games:.1f}%, Эло {format_elo(elo, low, high)}"
+                )
+        # Время на ход для каждого игрока
+        lines.append("")
+        lines.append("Среднее время на ход:")
+        for spec in self.players:
+            think_time = 0.0
+            think_moves = 0
+            for record in records:
+                for side, player in enumerate((record["white"], record["black"])):
+                    if player == spec:
+                        think_time += record["think_time"][side]
+                        think_moves += record["think_moves"][side]
+            if think_moves:
+                lines.append(f"  {spec}: {1000 * think_time / think_moves:.2f} мс ({think_moves} ходов)")
+        # Общая скорость
+        plies = sum(len(record["moves"]) for record in records)
+        game_time = sum(record["elapsed"] for record in records)
+        lines.append("")
+        lines.append(f"Полуходов: {plies}, в среднем за партию: {plies / max(1, len(records)):.1f}")
+        lines.append(f"Полуходов в секунду: {plies / max(wall_time, 1e-9):.1f} (всего), "
+                     f"{plies / max(game_time, 1e-9):.1f} (на процесс)")
+        lines.append(f"Время турнира: {wall_time:.1f} с")
+        return "\n".join(lines)
+
+
+# Запуск турнира
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Турнир между автоматическими игроками")
+    parser.add_argument("players", nargs="+", help="игроки: random, greedy, search:N, qsearch:N или book:PATH:SPEC")
+    parser.add_argument("--game", choices=sorted(GAME_TYPES), default="chess", help="тип игры")
+    parser.add_argument("--games", type=int, default=100, help="число партий для каждой пары игроков")
+    parser.add_argument("--opening-plies", type=int, default=4, help="число случайных полуходов в начале партии")
+    parser.add_argument("--max-plies", type=int, default=200, help="предел длины партии в полуходах")
+    parser.add_argument("--workers", type=int, default=None, help="число рабочих процессов")
+    parser.add_argument("--seed", type=int, default=0, help="начальное значение генератора случайных чисел")
+    parser.add_argument("--output", default=None, help="файл для записи партий")
+    args = parser.parse_args()
+
+    tournament = Tournament(args.game, args.players, args.games, args.opening_plies, args.max_plies, args.workers, args.seed)
+    records, wall_time = tournament.run(args.output)
+    print(tournament.report(records, wall_time))
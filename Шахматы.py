@@ -1,3 +1,4 @@
+import random
 from enum import Enum, auto
 
 # Перечисление для цветов фигур
@@ -297,22 +298,27 @@ class King(Piece):
         """
         x1, y1 = start
         x2, y2 = end
-        # Король не должен находиться под шахом
-        if board.is_in_check(self.color):
+        # Король должен стоять на исходном поле и ни разу не ходить
+        if start != ((7 if self.color == Color.WHITE else 0), 4) or start in board.moved_squares:
             return False
         # Определяем направление рокировки
         direction = 1 if y2 > y1 else -1
-        # Проверяем, свободен ли путь
+        # Проверяем, что ладья на месте и не двигалась
+        rook_x, rook_y = x1, 7 if direction == 1 else 0
+        rook = board.get_piece(rook_x, rook_y)
+        if not isinstance(rook, Rook) or rook.color != self.color or (rook_x, rook_y) in board.moved_squares:
+            return False
+        # Проверяем, свободен ли путь между королем и ладьей (включая поле назначения короля)
         y = y1 + direction
-        while y != y2:
+        while y != rook_y:
             if board.get_piece(x1, y):
                 return False
             y += direction
-        # Проверяем, что ладья не двигалась
-        rook_x, rook_y = x1, 7 if direction == 1 else 0
-        rook = board.get_piece(rook_x, rook_y)
-        if not isinstance(rook, Rook) or rook.color != self.color:
-            return False
+        # Король не должен находиться под шахом, проходить через битое поле или вставать под бой
+        opponent = Color.BLACK if self.color == Color.WHITE else Color.WHITE
+        for y in (y1, y1 + direction, y2):
+            if board.is_square_attacked((x1, y), opponent):
+                return False
         return True
 
 # Класс для шашки
@@ -339,8 +345,8 @@ class Checker(Piece):
         if abs(y2 - y1) == 1 and x2 == x1 + direction and not board.get_piece(x2, y2):
             return True
 
-        # Ход с взятием
-        if abs(y2 - y1) == 2 and x2 == x1 + 2 * direction:
+        # Ход с взятием (поле за взятой шашкой должно быть свободно)
+        if abs(y2 - y1) == 2 and x2 == x1 + 2 * direction and not board.get_piece(x2, y2):
             mid_x = x1 + direction
             mid_y = (y1 + y2) // 2
             mid_piece = board.get_piece(mid_x, mid_y)
@@ -379,11 +385,12 @@ class CheckerKing(Piece):
         x1, y1 = start
         x2, y2 = end
 
-        # Дамка может ходить на любое количество клеток по диагонали
-        if abs(x2 - x1) == abs(y2 - y1):
-            return self.is_path_clear(start, end, board)
+        # Дамка ходит по диагонали только на свободное поле
+        if x1 == x2 or abs(x2 - x1) != abs(y2 - y1) or board.get_piece(x2, y2):
+            return False
 
-        return False
+        # Дамка может ходить на любое количество клеток по диагонали или бить одну фигуру противника на пути
+        return self.is_path_clear(start, end, board) or self.get_jumped_position(start, end, board) is not None
 
     def is_path_clear(self, start, end, board):
         """
@@ -409,6 +416,55 @@ class CheckerKing(Piece):
 
         return True
 
+    def get_jumped_position(self, start, end, board):
+        """
+        Находит фигуру противника, которую дамка бьет, проходя от начальной позиции к конечной.
+
+        :param start: Кортеж (x, y) начальной позиции.
+        :param end: Кортеж (x, y) конечной позиции.
+        :param board: Объект доски.
+        :return: Кортеж (x, y) позиции взятой фигуры или None, если на пути не ровно одна фигура противника.
+        """
+        x1, y1 = start
+        x2, y2 = end
+
+        step_x = 1 if x2 > x1 else -1
+        step_y = 1 if y2 > y1 else -1
+
+        jumped = None
+        x, y = x1 + step_x, y1 + step_y
+        while x != x2 and y != y2:
+            piece = board.get_piece(x, y)
+            if piece:
+                if jumped or piece.color == self.color:
+                    return None
+                jumped = (x, y)
+            x += step_x
+            y += step_y
+
+        return jumped
+
+# Ценность фигур в пешках (для оценки позиции автоматическими игроками)
+PIECE_VALUES = {
+    Pawn: 1,
+    Knight: 3,
+    Bishop: 3,
+    Rook: 5,
+    Queen: 9,
+    King: 0,
+    Checker: 1,
+    CheckerKing: 3,
+}
+
+# Случайные ключи для хеширования позиции методом Зобриста (фиксированный seed, чтобы ключи совпадали между запусками)
+_zobrist_rng = random.Random(0)
+ZOBRIST_KEYS = {
+    (piece_type, color): [_zobrist_rng.getrandbits(64) for _ in range(64)]
+    for piece_type in PIECE_VALUES
+    for color in Color
+}
+ZOBRIST_BLACK_TO_MOVE = _zobrist_rng.getrandbits(64)
+
 # Класс для представления доски
 class Board:
     def __init__(self, game_type):
@@ -419,6 +475,7 @@ class Board:
         self.game_type = game_type
         self.setup_pieces()
         self.en_passant_target = None  # Поле для взятия на проходе (для шахмат)
+        self.moved_squares = set()  # Поля, с которых или на которые уже ходили (для рокировки)
 
     def setup_pieces(self):
         """
@@ -473,40 +530,64 @@ class Board:
         """
         return self.board[x][y]
 
-    def move_piece(self, start, end):
+    def copy(self):
+        """
+        Создает копию доски. Фигуры не изменяются во время игры, поэтому копируются только ссылки на них.
+
+        :return: Новый объект доски с той же позицией.
+        """
+        clone = Board.__new__(Board)
+        clone.board = [row[:] for row in self.board]
+        clone.game_type = self.game_type
+        clone.en_passant_target = self.en_passant_target
+        clone.moved_squares = set(self.moved_squares)
+        return clone
+
+    def move_piece(self, start, end, promotion=None):
         """
         Перемещает фигуру с начальной позиции на конечную.
 
         :param start: Кортеж (x, y) начальной позиции.
         :param end: Кортеж (x, y) конечной позиции.
+        :param promotion: Класс фигуры для превращения пешки (если None, выбор запрашивается у игрока).
         :return: True, если ход выполнен успешно, иначе False.
         """
         x1, y1 = start
         x2, y2 = end
         piece = self.board[x1][y1]
         if piece:
+            captured = self.get_captured_position(start, end)
             self.board[x2][y2] = piece
             self.board[x1][y1] = None
+            self.moved_squares.add(start)
+            self.moved_squares.add(end)
+            # Снимаем фигуру противника, через которую перепрыгнули (для шашек)
+            if captured and captured != end:
+                self.board[captured[0]][captured[1]] = None
             # Превращение пешки в ферзя (для шахмат)
             if isinstance(piece, Pawn) and (x2 == 0 or x2 == 7):
-                self.promote_pawn((x2, y2))
+                self.promote_pawn((x2, y2), promotion)
             # Превращение шашки в дамку (для шашек)
             if isinstance(piece, Checker) and (x2 == 0 or x2 == 7):
                 piece.promote_to_king((x2, y2), self)
             return True
         return False
 
-    def promote_pawn(self, pos):
+    def promote_pawn(self, pos, promotion=None):
         """
         Превращает пешку в выбранную фигуру, когда она достигает последней горизонтали.
 
         :param pos: Кортеж (x, y) позиции пешки.
+        :param promotion: Класс фигуры для превращения (если None, выбор запрашивается у игрока).
         """
         x, y = pos
         pawn = self.board[x][y]
         if not isinstance(pawn, Pawn):
             return
         color = pawn.color
+        if promotion:
+            self.board[x][y] = promotion(color)
+            return
         # Выбор фигуры для превращения
         print("Выберите фигуру для превращения пешки:")
         print("1. Ферзь (Q)")
@@ -536,12 +617,33 @@ class Board:
         king_pos = self.find_king(color)
         if not king_pos:
             return False
-        x, y = king_pos
+        return self.is_square_attacked(king_pos, Color.BLACK if color == Color.WHITE else Color.WHITE)
+
+    def is_square_attacked(self, square, color):
+        """
+        Проверяет, бьет ли поле хотя бы одна фигура указанного цвета.
+
+        :param square: Кортеж (x, y) поля.
+        :param color: Цвет атакующих фигур.
+        :return: True, если поле под боем, иначе False.
+        """
+        x, y = square
         # Проверка всех фигур противника
         for i in range(8):
             for j in range(8):
                 piece = self.board[i][j]
-                if piece and piece.color != color and piece.is_valid_move((i, j), (x, y), self):
+                if not piece or piece.color != color:
+                    continue
+                # Пешка бьет по диагонали, даже если поле пустое
+                if isinstance(piece, Pawn):
+                    direction = -1 if piece.color == Color.WHITE else 1
+                    if x == i + direction and abs(y - j) == 1:
+                        return True
+                    continue
+                # Рокировка не нападает на поле
+                if isinstance(piece, King) and abs(y - j) > 1:
+                    continue
+                if piece.is_valid_move((i, j), (x, y), self):
                     return True
         return False
 
@@ -590,6 +692,186 @@ class Board:
                                 self.board[x][y] = temp
         return True
 
+    def get_legal_moves(self, color, captures_only=False):
+        """
+        Возвращает все допустимые ходы фигур указанного цвета.
+        Ходы, после которых свой король остается под шахом, отбрасываются.
+
+        :param color: Цвет фигур (Color.WHITE или Color.BLACK).
+        :param captures_only: Если True, возвращаются только взятия.
+        :return: Список ходов в виде кортежей (start, end).
+        """
+        moves = []
+        for i in range(8):
+            for j in range(8):
+                piece = self.board[i][j]
+                if not piece or piece.color != color:
+                    continue
+                for x in range(8):
+                    for y in range(8):
+                        target = self.board[x][y]
+                        if target and target.color == color:
+                            continue
+                        if captures_only and not self.get_captured_piece((i, j), (x, y)):
+                            continue
+                        if not piece.is_valid_move((i, j), (x, y), self):
+                            continue
+                        # Пробуем сделать ход
+                        self.board[x][y] = piece
+                        self.board[i][j] = None
+                        in_check = self.is_in_check(color)
+                        # Отменяем ход
+                        self.board[i][j] = piece
+                        self.board[x][y] = target
+                        if not in_check:
+                            moves.append(((i, j), (x, y)))
+        return moves
+
+    def get_captured_position(self, start, end):
+        """
+        Возвращает позицию фигуры, которая будет взята при указанном ходе.
+
+        :param start: Кортеж (x, y) начальной позиции.
+        :param end: Кортеж (x, y) конечной позиции.
+        :return: Кортеж (x, y) позиции взятой фигуры или None, если ход не является взятием.
+        """
+        x1, y1 = start
+        x2, y2 = end
+        piece = self.board[x1][y1]
+        # Шашка бьет фигуру, через которую перепрыгивает
+        if isinstance(piece, Checker):
+            if abs(x2 - x1) == 2 and self.board[(x1 + x2) // 2][(y1 + y2) // 2]:
+                return ((x1 + x2) // 2, (y1 + y2) // 2)
+            return None
+        # Дамка бьет фигуру на своем пути
+        if isinstance(piece, CheckerKing):
+            if x1 == x2 or abs(x2 - x1) != abs(y2 - y1):
+                return None
+            return piece.get_jumped_position(start, end, self)
+        # Взятие на проходе
+        if isinstance(piece, Pawn) and y1 != y2 and (x2, y2) == self.en_passant_target:
+            return (x1, y2)
+        return end if self.board[x2][y2] else None
+
+    def get_captured_piece(self, start, end):
+        """
+        Возвращает фигуру, которая будет взята при указанном ходе.
+
+        :param start: Кортеж (x, y) начальной позиции.
+        :param end: Кортеж (x, y) конечной позиции.
+        :return: Взятая фигура или None, если ход не является взятием.
+        """
+        captured = self.get_captured_position(start, end)
+        return self.get_piece(*captured) if captured else None
+
+    def get_attackers(self, square, color):
+        """
+        Находит ходы фигур указанного цвета, которые бьют фигуру на заданном поле.
+        Взятия определяются так же, как в get_legal_moves, но связки не учитываются.
+
+        :param square: Кортеж (x, y) поля с фигурой противника.
+        :param color: Цвет атакующих фигур.
+        :return: Список ходов (start, end), начиная с самой дешевой атакующей фигуры.
+        """
+        # В шахматах фигура бьет, вставая на поле (кроме взятия на проходе), в шашках - перепрыгивая через него
+        if self.game_type == "checkers":
+            ends = [(x, y) for x in range(8) for y in range(8)]
+        else:
+            ends = [square]
+            if self.en_passant_target:
+                ends.append(self.en_passant_target)
+        attackers = []
+        for i in range(8):
+            for j in range(8):
+                piece = self.board[i][j]
+                if not piece or piece.color != color:
+                    continue
+                for end in ends:
+                    if self.get_captured_position((i, j), end) != square:
+                        continue
+                    if piece.is_valid_move((i, j), end, self):
+                        attackers.append(((i, j), end))
+        attackers.sort(key=lambda move: self.exchange_value(self.get_piece(*move[0])))
+        return attackers
+
+    def exchange_value(self, piece):
+        """
+        Возвращает ценность фигуры для размена. Король считается самой ценной фигурой,
+        чтобы он бил последним и не вставал под бой.
+
+        :param piece: Фигура.
+        :return: Ценность фигуры в пешках.
+        """
+        if isinstance(piece, King):
+            return 100
+        return PIECE_VALUES[type(piece)]
+
+    def static_exchange(self, move):
+        """
+        Оценивает размен, который начинается указанным взятием (статическая оценка размена).
+        Стороны поочередно бьют последнюю взявшую фигуру самой дешевой атакующей фигурой
+        и могут остановиться, если продолжение им невыгодно. Доска при этом не изменяется.
+
+        :param move: Кортеж (start, end) с первым взятием.
+        :return: Выигрыш материала стороны, начинающей размен (в пешках).
+        """
+        start, end = move
+        piece = self.get_piece(*start)
+        captured = self.get_captured_piece(start, end)
+        if not piece or not captured:
+            return 0
+        # Разыгрываем размен на копии доски
+        board = self.copy()
+        gains = [self.exchange_value(captured)]
+        while True:
+            x1, y1 = start
+            x2, y2 = end
+            # Снимаем взятую фигуру, если она стоит не на конечном поле
+            captured = board.get_captured_position(start, end)
+            if captured != end:
+                board.board[captured[0]][captured[1]] = None
+            board.board[x2][y2] = piece
+            board.board[x1][y1] = None
+            attackers = board.get_attackers(end, Color.BLACK if piece.color == Color.WHITE else Color.WHITE)
+            if not attackers:
+                break
+            gains.append(self.exchange_value(piece) - gains[-1])
+            start, end = attackers[0]
+            piece = board.get_piece(*start)
+        # Каждая сторона выбирает между продолжением размена и остановкой
+        for i in range(len(gains) - 1, 0, -1):
+            gains[i - 1] = -max(-gains[i - 1], gains[i])
+        return gains[0]
+
+    def position_key(self, color):
+        """
+        Вычисляет 64-битный ключ позиции (хеш Зобриста) с учетом стороны, чей ход.
+
+        :param color: Цвет стороны, чей ход.
+        :return: Целое число от 0 до 2**64 - 1.
+        """
+        key = ZOBRIST_BLACK_TO_MOVE if color == Color.BLACK else 0
+        for i, row in enumerate(self.board):
+            for j, piece in enumerate(row):
+                if piece:
+                    key ^= ZOBRIST_KEYS[(type(piece), piece.color)][i * 8 + j]
+        return key
+
+    def material_balance(self, color):
+        """
+        Считает материальный перевес указанной стороны.
+
+        :param color: Цвет стороны (Color.WHITE или Color.BLACK).
+        :return: Разность ценности своих фигур и фигур противника.
+        """
+        score = 0
+        for row in self.board:
+            for piece in row:
+                if piece:
+                    value = PIECE_VALUES[type(piece)]
+                    score += value if piece.color == color else -value
+        return score
+
 # Базовый класс игры
 class Game:
     def __init__(self, game_type):
@@ -613,7 +895,7 @@ class Game:
                     break
             move = input("Введите ваш ход (например, 'e2 e4'): ")
             if self.make_move(move):
-                self.current_turn = Color.BLACK if self.current_turn == Color.WHITE else Color.WHITE
+                self.switch_turn()
             else:
                 print("Некорректный ход, попробуйте снова.")
 
@@ -630,19 +912,71 @@ class Game:
             x2, y2 = self.parse_position(end)
             piece = self.board.get_piece(x1, y1)
             if piece and piece.color == self.current_turn and piece.is_valid_move((x1, y1), (x2, y2), self.board):
-                # Выполняем рокировку
-                if isinstance(piece, King) and abs(y2 - y1) == 2:
-                    self.castle((x1, y1), (x2, y2))
-                # Выполняем взятие на проходе
-                elif isinstance(piece, Pawn) and (x2, y2) == self.board.en_passant_target:
-                    self.en_passant((x1, y1), (x2, y2))
-                else:
-                    self.board.move_piece((x1, y1), (x2, y2))
+                self.execute_move((x1, y1), (x2, y2))
                 return True
             return False
         except:
             return False
 
+    def execute_move(self, start, end, promotion=None):
+        """
+        Выполняет ход без проверки его допустимости, учитывая рокировку и взятие на проходе.
+
+        :param start: Кортеж (x, y) начальной позиции.
+        :param end: Кортеж (x, y) конечной позиции.
+        :param promotion: Класс фигуры для превращения пешки (если None, выбор запрашивается у игрока).
+        """
+        x1, y1 = start
+        x2, y2 = end
+        piece = self.board.get_piece(x1, y1)
+        # Выполняем рокировку
+        if isinstance(piece, King) and abs(y2 - y1) == 2:
+            self.castle((x1, y1), (x2, y2))
+        # Выполняем взятие на проходе
+        elif isinstance(piece, Pawn) and (x2, y2) == self.board.en_passant_target:
+            self.en_passant((x1, y1), (x2, y2))
+        else:
+            self.board.move_piece((x1, y1), (x2, y2), promotion)
+
+    def switch_turn(self):
+        """
+        Передает ход другой стороне.
+        """
+        self.current_turn = Color.BLACK if self.current_turn == Color.WHITE else Color.WHITE
+
+    def copy(self):
+        """
+        Создает копию игры с копией доски (используется при переборе ходов).
+
+        :return: Новый объект игры того же типа.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.board = self.board.copy()
+        clone.current_turn = self.current_turn
+        return clone
+
+    def get_result(self, legal_moves=None):
+        """
+        Определяет результат партии в текущей позиции.
+
+        :param legal_moves: Уже найденные допустимые ходы стороны, чей ход (если None, они будут найдены).
+        :return: Цвет победителя, "draw" при ничьей или None, если партия продолжается.
+        """
+        if legal_moves is None:
+            legal_moves = self.board.get_legal_moves(self.current_turn)
+        opponent = Color.BLACK if self.current_turn == Color.WHITE else Color.WHITE
+        if not legal_moves:
+            # В шашках проигрывает тот, кому некуда ходить; в шахматах это мат или пат
+            if self.board.game_type == "checkers" or self.board.is_in_check(self.current_turn):
+                return opponent
+            return "draw"
+        # В шахматах остались только короли
+        if self.board.game_type == "chess":
+            pieces = [piece for row in self.board.board for piece in row if piece]
+            if all(isinstance(piece, King) for piece in pieces):
+                return "draw"
+        return None
+
     def castle(self, start, end):
         """
         Выполняет рокировку.
@@ -687,6 +1021,16 @@ class Game:
         y = ord(pos[0]) - ord('a')
         return x, y
 
+    def format_position(self, pos):
+        """
+        Преобразует координаты доски (x, y) в шахматную нотацию (например, "e2").
+
+        :param pos: Кортеж (x, y) координат доски.
+        :return: Строка с позицией в шахматной нотации.
+        """
+        x, y = pos
+        return f"{chr(ord('a') + y)}{8 - x}"
+
 # Класс для шахмат
 class ChessGame(Game):
     def __init__(self):
@@ -697,6 +1041,196 @@ class CheckersGame(Game):
     def __init__(self):
         super().__init__("checkers")
 
+# Базовый класс автоматического игрока
+class Player:
+    def __init__(self, rng=None):
+        """
+        Инициализирует игрока с генератором случайных чисел.
+
+        :param rng: Объект random.Random (если None, создается новый).
+        """
+        self.rng = rng or random.Random()
+
+    def choose_move(self, game, moves=None):
+        """
+        Выбирает ход для стороны, чей сейчас ход.
+
+        :param game: Объект игры.
+        :param moves: Уже найденные допустимые ходы (если None, они будут найдены).
+        :return: Кортеж (start, end) или None, если ходов нет.
+        """
+        raise NotImplementedError("Метод должен быть реализован в подклассе")
+
+# Игрок, делающий случайные ходы
+class RandomPlayer(Player):
+    def choose_move(self, game, moves=None):
+        """
+        Выбирает случайный допустимый ход.
+
+        :param game: Объект игры.
+        :param moves: Уже найденные допустимые ходы (если None, они будут найдены).
+        :return: Кортеж (start, end) или None, если ходов нет.
+        """
+        if moves is None:
+            moves = game.board.get_legal_moves(game.current_turn)
+        return self.rng.choice(moves) if moves else None
+
+# Игрок, выбирающий ход с наибольшим немедленным выигрышем материала
+class GreedyPlayer(Player):
+    def choose_move(self, game, moves=None):
+        """
+        Выбирает ход, после которого материальный перевес максимален.
+
+        :param game: Объект игры.
+        :param moves: Уже найденные допустимые ходы (если None, они будут найдены).
+        :return: Кортеж (start, end) или None, если ходов нет.
+        """
+        color = game.current_turn
+        best_score = None
+        best_moves = []
+        if moves is None:
+            moves = game.board.get_legal_moves(color)
+        for move in moves:
+            child = game.copy()
+            child.execute_move(*move, promotion=Queen)
+            score = child.board.material_balance(color)
+            if best_score is None or score > best_score:
+                best_score = score
+                best_moves = [move]
+            elif score == best_score:
+                best_moves.append(move)
+        return self.rng.choice(best_moves) if best_moves else None
+
+# Игрок, перебирающий ходы на заданную глубину (негамакс с альфа-бета отсечением)
+class SearchPlayer(Player):
+    MATE_SCORE = 1000
+
+    def __init__(self, depth=2, rng=None, quiescence=False, see_pruning=True):
+        """
+        Инициализирует игрока с глубиной перебора.
+
+        :param depth: Глубина перебора в полуходах.
+        :param rng: Объект random.Random (если None, создается новый).
+        :param quiescence: Если True, после основного перебора продолжаются взятия.
+        :param see_pruning: Если True, взятия в форсированном переборе упорядочиваются
+                            статической оценкой размена, а проигрывающие взятия отбрасываются.
+        """
+        super().__init__(rng)
+        self.depth = depth
+        self.quiescence = quiescence
+        self.see_pruning = see_pruning
+        self.nodes = 0
+
+    def choose_move(self, game, moves=None):
+        """
+        Выбирает лучший ход по результатам перебора.
+
+        :param game: Объект игры.
+        :param moves: Уже найденные допустимые ходы (если None, они будут найдены).
+        :return: Кортеж (start, end) или None, если ходов нет.
+        """
+        if moves is None:
+            moves = game.board.get_legal_moves(game.current_turn)
+        moves = list(moves)
+        # Перемешиваем ходы, чтобы среди равных выбирался случайный
+        self.rng.shuffle(moves)
+        best_move = None
+        alpha = -self.MATE_SCORE - 1
+        for move in self.order_moves(game.board, moves):
+            child = game.copy()
+            child.execute_move(*move, promotion=Queen)
+            child.switch_turn()
+            score = -self.negamax(child, self.depth - 1, -self.MATE_SCORE - 1, -alpha)
+            if best_move is None or score > alpha:
+                best_move = move
+                alpha = score
+        return best_move
+
+    def negamax(self, game, depth, alpha, beta):
+        """
+        Оценивает позицию перебором с альфа-бета отсечением.
+
+        :param game: Объект игры.
+        :param depth: Оставшаяся глубина перебора.
+        :param alpha: Нижняя граница оценки.
+        :param beta: Верхняя граница оценки.
+        :return: Оценка позиции с точки зрения стороны, чей ход.
+        """
+        if depth <= 0 and self.quiescence:
+            return self.quiescence_search(game, alpha, beta)
+        self.nodes += 1
+        if depth <= 0:
+            return self.evaluate(game)
+        moves = game.board.get_legal_moves(game.current_turn)
+        if not moves:
+            return 0 if game.get_result(moves) == "draw" else -self.MATE_SCORE
+        for move in self.order_moves(game.board, moves):
+            child = game.copy()
+            child.execute_move(*move, promotion=Queen)
+            child.switch_turn()
+            score = -self.negamax(child, depth - 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def quiescence_search(self, game, alpha, beta):
+        """
+        Форсированный перебор, в котором рассматриваются только взятия.
+        Сторона, чей ход, может не брать и согласиться со статической оценкой.
+
+        :param game: Объект игры.
+        :param alpha: Нижняя граница оценки.
+        :param beta: Верхняя граница оценки.
+        :return: Оценка позиции с точки зрения стороны, чей ход.
+        """
+        self.nodes += 1
+        stand_pat = self.evaluate(game)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        board = game.board
+        moves = board.get_legal_moves(game.current_turn, captures_only=True)
+        if self.see_pruning:
+            scored = [(board.static_exchange(move), move) for move in moves]
+            # Взятия, после которых размен проигрывается, не рассматриваются
+            scored = [(gain, move) for gain, move in scored if gain >= 0]
+            scored.sort(key=lambda item: item[0], reverse=True)
+            moves = [move for _, move in scored]
+        else:
+            moves = self.order_moves(board, moves)
+        for move in moves:
+            child = game.copy()
+            child.execute_move(*move, promotion=Queen)
+            child.switch_turn()
+            score = -self.quiescence_search(child, -beta, -alpha)
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def evaluate(self, game):
+        """
+        Статическая оценка позиции.
+
+        :param game: Объект игры.
+        :return: Материальный перевес стороны, чей ход.
+        """
+        return game.board.material_balance(game.current_turn)
+
+    def order_moves(self, board, moves):
+        """
+        Упорядочивает ходы: сначала взятия самых ценных фигур.
+
+        :param board: Объект доски.
+        :param moves: Список ходов (start, end).
+        :return: Новый упорядоченный список ходов.
+        """
+        def capture_value(move):
+            captured = board.get_captured_piece(*move)
+            return PIECE_VALUES[type(captured)] if captured else 0
+        return sorted(moves, key=capture_value, reverse=True)
+
 # Запуск игры
 if __name__ == "__main__":
     print("Выберите игру:")